@@ -1,7 +1,20 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import jellyfin_config as config
 
@@ -10,6 +23,11 @@ JELLYFIN_URL: str = config.JELLYFIN_SERVER.rstrip("/")
 API_KEY: str = config.API_KEY
 USER_ID: str = config.USER_ID
 
+# Full URLs of the endpoints the metrics call, built once
+_ITEMS_URL: str = f"{JELLYFIN_URL}/emby/Users/{USER_ID}/Items"
+_COUNTS_URL: str = f"{JELLYFIN_URL}/emby/Users/{USER_ID}/Items/Counts"
+_PLUGINS_URL: str = f"{JELLYFIN_URL}/emby/Plugins"
+
 PRIVACY_FOCUSED_PLUGINS = [
     "autoboxset",
     "intro skipper",
@@ -19,23 +37,244 @@ PRIVACY_FOCUSED_PLUGINS = [
     "autoorganize"
 ]
 
+# All privacy-focused plugin names as one case-insensitive alternation, matched
+# in a single scan per installed plugin name without lowercasing it first
+_PRIVACY_PATTERN = re.compile("|".join(re.escape(name) for name in PRIVACY_FOCUSED_PLUGINS), re.IGNORECASE)
+
 HEADERS: Dict[str, str] = {
     "X-Emby-Token": API_KEY,
     "Accept": "application/json"
 }
 
+# Fields needed by every item-based metric, fetched once and shared.
+# ImageTags is not a Fields value; it is narrowed with EnableImageTypes instead.
+ITEM_FIELDS: Tuple[str, ...] = ("MediaStreams", "Overview", "Genres", "ChildCount")
+
+# Items requested per /Items page, and how many pages are fetched at once
+ITEMS_PAGE_SIZE: int = 500
+MAX_PAGE_WORKERS: int = 3
+
+# Seconds before a cached /Items payload is considered stale
+ITEMS_CACHE_TTL: int = 300
+
+# Connect/read timeouts (seconds) for every Jellyfin request
+REQUEST_TIMEOUT: Tuple[float, float] = (3.05, 30)
+
+# Where ETags and response bodies are kept for conditional requests
+HTTP_CACHE_DIR: Path = Path.home() / ".cache" / "jellyfin_metric_score"
+
+# One pooled keep-alive session shared by all requests (and threads)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.headers.update(HEADERS)
+
+def _cache_paths(url: str, params: Optional[Dict[str, Any]]) -> Tuple[Path, Path]:
+    key = hashlib.sha1(f"{url}?{sorted((params or {}).items())}".encode()).hexdigest()
+    return HTTP_CACHE_DIR / f"{key}.json", HTTP_CACHE_DIR / f"{key}.etag"
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Writes data to a temp file beside path and swaps it in, so readers never
+    see a partially written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+def _clear_cache(*paths: Path) -> None:
+    for path in paths:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
 def jellyfin_get(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    url = f"{JELLYFIN_URL}/emby{endpoint}"
-    response = requests.get(url, headers=HEADERS, params=params)
+    """
+    GETs a Jellyfin endpoint and decodes the JSON body. Responses that carry an
+    ETag are cached on disk and revalidated with If-None-Match, so an unchanged
+    payload comes back as an empty 304 and is read from the cache instead.
+
+    endpoint may be a full URL or a path relative to the server's /emby root.
+    """
+    url = endpoint if endpoint.startswith(("http://", "https://")) else f"{JELLYFIN_URL}/emby{endpoint}"
+    body_path, etag_path = _cache_paths(url, params)
+
+    headers = {}
+    if body_path.exists() and etag_path.exists():
+        try:
+            headers["If-None-Match"] = etag_path.read_text()
+        except OSError:
+            pass
+
+    response = _SESSION.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        try:
+            return orjson.loads(body_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            # Cached body is missing or corrupt; drop it so the stale ETag stops
+            # producing 304s, and refetch unconditionally
+            _clear_cache(body_path, etag_path)
+            response = _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
-    return response.json()
 
-# --- METRIC FUNCTIONS ---
+    etag = response.headers.get("ETag")
+    if etag:
+        try:
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop the old ETag first so it can never pair with a newer body
+            etag_path.unlink(missing_ok=True)
+            _atomic_write(body_path, response.content)
+            _atomic_write(etag_path, etag.encode())
+        except OSError:
+            pass  # caching is best-effort; the fresh response is still returned
 
-def get_total_item_count() -> int:
-    data = jellyfin_get(f"/Users/{USER_ID}/Items")
-    return data.get("TotalRecordCount", 0)
+    return orjson.loads(response.content)
+
+def jellyfin_count(endpoint: str, params: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Returns only TotalRecordCount for a query; Limit=0 keeps Jellyfin from
+    serializing any items.
+    """
+    query = dict(params or {})
+    query.update({"Limit": 0, "EnableTotalRecordCount": "true"})
+    return jellyfin_get(endpoint, query).get("TotalRecordCount", 0)
 
+def jellyfin_get_paginated(endpoint: str, params: Optional[Dict[str, Any]] = None,
+                           page_size: int = ITEMS_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Yields every item of a paged endpoint in order. The total is probed with a
+    count query, then pages of page_size are fetched concurrently over the
+    pooled session so the server never has to serialize the whole library at once.
+    At most MAX_PAGE_WORKERS pages are requested or held ahead of the consumer.
+    """
+    # Pages are separate queries, so pin a deterministic order or items can be
+    # skipped or repeated at page boundaries
+    query_params = dict(params or {})
+    query_params.update({"SortBy": "SortName,DateCreated", "SortOrder": "Ascending"})
+    total = jellyfin_count(endpoint, query_params)
+
+    def fetch_page(start: int) -> List[Dict[str, Any]]:
+        query = dict(query_params)
+        query.update({"StartIndex": start, "Limit": page_size})
+        return jellyfin_get(endpoint, query).get("Items", [])
+
+    starts = iter(range(0, total, page_size))
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+        pending = deque(executor.submit(fetch_page, start) for start in islice(starts, MAX_PAGE_WORKERS))
+        while pending:
+            page = pending.popleft().result()
+            pending.extend(executor.submit(fetch_page, start) for start in islice(starts, 1))
+            yield from page
+
+def _slim_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keeps only the keys the scorers read, so the cached payload does not pin
+    overviews, user data and the rest of each stream's metadata in memory.
+    """
+    return {
+        "Type": item.get("Type"),
+        "ChildCount": item.get("ChildCount", 0),
+        "Overview": bool(item.get("Overview")),
+        "Genres": bool(item.get("Genres")),
+        "ImageTags": {"Primary": True} if "Primary" in item.get("ImageTags", {}) else {},
+        "MediaStreams": [
+            {
+                "Type": stream.get("Type"),
+                "Height": stream.get("Height", 0),
+                "DisplayTitle": stream.get("DisplayTitle", "")
+            }
+            for stream in item.get("MediaStreams", [])
+        ]
+    }
+
+@lru_cache(maxsize=2)
+def _fetch_all_items(fields_key: Tuple[str, ...], ttl_bucket: int = 0) -> Tuple[Dict[str, Any], ...]:
+    """
+    Fetches every library item once with the given Fields and caches the result.
+    ttl_bucket is only part of the cache key, so a new bucket forces a refetch.
+    """
+    items = jellyfin_get_paginated(_ITEMS_URL, {
+        "Recursive": "true",
+        "Fields": ",".join(fields_key),
+        "EnableImageTypes": "Primary",  # only the poster tag is scored
+        "ImageTypeLimit": 1,
+        "EnableUserData": "false"
+    })
+    return tuple(_slim_item(item) for item in items)
+
+def get_all_items(fields: Tuple[str, ...] = ITEM_FIELDS) -> Tuple[Dict[str, Any], ...]:
+    """
+    Returns the shared /Items payload, refetching after ITEMS_CACHE_TTL seconds.
+    """
+    return _fetch_all_items(fields, int(time.monotonic() // ITEMS_CACHE_TTL))
+
+def _filter_types(items: Sequence[Dict[str, Any]], *types: str) -> list:
+    return [item for item in items if item.get("Type") in types]
+
+# --- METRIC REGISTRY ---
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """
+    Everything the report needs to know about one metric.
+
+    Attributes:
+        name: Category name shown in the report.
+        max_score: Highest score the scorer can return.
+        weight: Importance when choosing the recommendation.
+        threshold: Percentage below which the recommendation applies.
+        pros_threshold: Percentage the category must exceed to count as a pro.
+        scorer: The metric function.
+        recommendation: Advice shown when this is the most critical issue.
+        pro_msg: Summary text when the category is a pro.
+        con_msg: Summary text when the category is a con.
+        uses_items: Whether the scorer takes the shared /Items payload.
+    """
+    name: str
+    max_score: int
+    weight: int
+    threshold: int
+    pros_threshold: int
+    scorer: Callable[..., int]
+    recommendation: str
+    pro_msg: str
+    con_msg: str
+    uses_items: bool = False
+
+# Every registered metric, in report order; extended only by @metric
+METRICS: Tuple[MetricSpec, ...] = ()
+
+def metric(name: str, max_score: int, weight: int, threshold: int, pros_threshold: int,
+           recommendation: str, pro_msg: str, con_msg: str, uses_items: bool = False) -> Callable:
+    """
+    Registers the decorated scorer as a metric. Metrics appear in the report
+    in the order they are defined.
+    """
+    def register(scorer: Callable[..., int]) -> Callable[..., int]:
+        global METRICS
+        METRICS += (MetricSpec(
+            name, max_score, weight, threshold, pros_threshold,
+            scorer, recommendation, pro_msg, con_msg, uses_items
+        ),)
+        return scorer
+    return register
+
+# --- METRIC FUNCTIONS ---
+
+@metric("Content Quantity", max_score=10, weight=4, threshold=50, pros_threshold=80,
+        recommendation="Increase the number of items in the library to improve content.",
+        pro_msg="Large library", con_msg="Small library")
 def get_content_quantity_score() -> int:
     """
     Calculate the content quantity score based on the total number of media items
@@ -44,17 +283,8 @@ def get_content_quantity_score() -> int:
     Returns:
         int: Score from 0 to 10 representing content quantity.
     """
-    import requests
-
-    url = f"{JELLYFIN_URL}/Users/{USER_ID}/Items/Counts"
-    headers = {
-        "X-Emby-Token": API_KEY
-    }
-
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+        data = jellyfin_get(_COUNTS_URL)
         total_items = data.get("AllMovies", 0) + data.get("AllTVShows", 0)
 
         if total_items >= 1000:
@@ -71,40 +301,55 @@ def get_content_quantity_score() -> int:
         return 0
 
 
-def get_content_quality_score() -> int:
+def _classify(heights: Sequence[int], hdr_flags: Sequence[bool]) -> Tuple[int, int, int, int]:
+    """
+    Counts UHD, FHD and HD video streams plus HDR streams in one fused pass.
+
+    Returns:
+        tuple: (uhd, fhd, hd, hdr) counts.
+    """
+    uhd = fhd = hd = hdr = 0
+    for height, is_hdr in zip(heights, hdr_flags):
+        if height >= 2160:
+            uhd += 1
+        elif height >= 1080:
+            fhd += 1
+        elif height >= 720:
+            hd += 1
+        if is_hdr:
+            hdr += 1
+    return uhd, fhd, hd, hdr
+
+@metric("Content Quality", max_score=20, weight=5, threshold=50, pros_threshold=70,
+        recommendation="Upgrade videos to higher resolutions to enhance overall content quality.",
+        pro_msg="High-resolution videos", con_msg="Low-resolution videos", uses_items=True)
+def get_content_quality_score(items: Optional[Sequence[Dict[str, Any]]] = None) -> int:
     """
     Scores content quality based on resolution tiers and HDR presence.
     Returns an integer score from 0 to 20.
     """
-    items = jellyfin_get(f"/Users/{USER_ID}/Items", {
-        "IncludeItemTypes": "Movie,Episode",
-        "Recursive": "true",
-        "Fields": "MediaStreams"
-    }).get("Items", [])
+    if items is None:
+        items = get_all_items()
+    items = _filter_types(items, "Movie", "Episode")
 
     if not items:
         return 0
 
     total = len(items)
-    uhd_count = fhd_count = hd_count = hdr_count = 0
+    heights = []
+    hdr_flags = []
+    add_height = heights.append
+    add_hdr = hdr_flags.append
 
     for item in items:
-        for stream in item.get("MediaStreams", []):
+        for stream in item.get("MediaStreams", ()):
             if stream.get("Type") == "Video":
-                height = stream.get("Height", 0)
-                title = stream.get("DisplayTitle", "").lower()
-
-                if height >= 2160:
-                    uhd_count += 1
-                elif height >= 1080:
-                    fhd_count += 1
-                elif height >= 720:
-                    hd_count += 1
-
-                if "hdr" in title:
-                    hdr_count += 1
+                add_height(stream.get("Height", 0))
+                add_hdr("hdr" in stream.get("DisplayTitle", "").lower())
                 break  # only check first video stream
 
+    uhd_count, fhd_count, hd_count, hdr_count = _classify(heights, hdr_flags)
+
     # Calculate percentages
     percent_uhd = uhd_count / total
     percent_fhd = fhd_count / total
@@ -119,35 +364,34 @@ def get_content_quality_score() -> int:
 
     return score
 
-def get_metadata_quality_score() -> int:
-    items = jellyfin_get(f"/Users/{USER_ID}/Items", {
-        "Recursive": "true",
-        "Fields": "Overview,Genres,ImageTags"
-    }).get("Items", [])
+@metric("Metadata Quality", max_score=20, weight=3, threshold=50, pros_threshold=70,
+        recommendation="Add missing metadata like movie posters and descriptions for a more organized library.",
+        pro_msg="Complete metadata", con_msg="Incomplete metadata", uses_items=True)
+def get_metadata_quality_score(items: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+    if items is None:
+        items = get_all_items()
 
     if not items:
         return 0
 
-    has_posters = has_overviews = has_genres = 0
-
-    for item in items:
-        if "Primary" in item.get("ImageTags", {}):
-            has_posters += 1
-        if item.get("Overview"):
-            has_overviews += 1
-        if item.get("Genres"):
-            has_genres += 1
+    # Only the combined fill rate feeds the score, so count every filled
+    # field (poster, overview, genres) in one builtin-driven pass
+    filled = sum(
+        ("Primary" in item.get("ImageTags", {})) + bool(item.get("Overview")) + bool(item.get("Genres"))
+        for item in items
+    )
 
     total = len(items)
-    score = int(((has_posters + has_overviews + has_genres) / (3 * total)) * 20)
+    score = int((filled / (3 * total)) * 20)
     return score
 
-def get_library_structure_score() -> int:
-    items = jellyfin_get(f"/Users/{USER_ID}/Items", {
-        "IncludeItemTypes": "Series",
-        "Recursive": "true",
-        "Fields": "ChildCount"
-    }).get("Items", [])
+@metric("Library Structure", max_score=15, weight=2, threshold=70, pros_threshold=60,
+        recommendation="Reorganize the library structure for better content accessibility.",
+        pro_msg="Organized libraries", con_msg="Disorganized libraries", uses_items=True)
+def get_library_structure_score(items: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+    if items is None:
+        items = get_all_items()
+    items = _filter_types(items, "Series")
 
     if not items:
         return 15  # No series to judge
@@ -156,6 +400,9 @@ def get_library_structure_score() -> int:
     ratio = good / len(items)
     return int(ratio * 15)
 
+@metric("Plugins", max_score=6, weight=4, threshold=50, pros_threshold=50,
+        recommendation="Install key plugins to improve functionality and enhance server performance.",
+        pro_msg="Essential key plugins", con_msg="Missing key plugins")
 def get_plugin_score() -> int:
     """
     Checks installed plugins against the privacy-focused essential stack.
@@ -164,58 +411,24 @@ def get_plugin_score() -> int:
     Returns:
         int: Score from 0 to 6 based on installed privacy-focused plugins.
     """
-    plugins = jellyfin_get("/Plugins")  # Assume this returns a list directly
-    names = [p.get("Name", "").lower() for p in plugins]
-    count = sum(1 for name in names if any(good in name for good in PRIVACY_FOCUSED_PLUGINS))
+    plugins = jellyfin_get(_PLUGINS_URL)  # Assume this returns a list directly
+    count = sum(1 for p in plugins if _PRIVACY_PATTERN.search(p.get("Name", "")))
     return min(6, count)
 
-def get_subtitles_score() -> int:
+@metric("Subtitles", max_score=5, weight=3, threshold=50, pros_threshold=70,
+        recommendation="Add subtitles to your media for better accessibility and user experience.",
+        pro_msg="Massive subtitle availability", con_msg="Limited subtitle availability", uses_items=True)
+def get_subtitle_score(items: Optional[Sequence[Dict[str, Any]]] = None) -> int:
     """
-    Calculates a score (0-5) based on the percentage of media items
-    that have subtitles available.
+    Calculates a score (0-5) based on the percentage of movies and episodes
+    that have at least one subtitle stream.
 
     Returns:
         int: Score from 0 to 5 representing subtitle availability.
     """
-
-    url = f"{JELLYFIN_URL}/Users/{USER_ID}/Items"
-    headers = {
-        "X-Emby-Token": API_KEY
-    }
-    params = {
-        "IncludeItemTypes": "Movie,Episode",
-        "Recursive": "true",
-        "Limit": 1000,
-        "Fields": "MediaStreams"
-    }
-
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        items = response.json().get("Items", [])
-        if not items:
-            return 0
-
-        subtitle_count = 0
-        total = len(items)
-
-        for item in items:
-            streams = item.get("MediaStreams", [])
-            if any(stream.get("Type") == "Subtitle" for stream in streams):
-                subtitle_count += 1
-
-        percentage = subtitle_count / total
-        return int(percentage * 5)
-    except Exception:
-        return 0
-
-
-def get_subtitle_support_score() -> int:
-    items = jellyfin_get(f"/Users/{USER_ID}/Items", {
-        "IncludeItemTypes": "Movie,Episode",
-        "Recursive": "true",
-        "Fields": "MediaStreams"
-    }).get("Items", [])
+    if items is None:
+        items = get_all_items()
+    items = _filter_types(items, "Movie", "Episode")
 
     if not items:
         return 0
@@ -225,79 +438,29 @@ def get_subtitle_support_score() -> int:
     ratio = sub_count / len(items)
     return int(min(5, ratio * 5))
 
-def generate_recommendation(content_quantity: float, content_quality: float, metadata_quality: float, 
-                            library_structure: float, plugins: float, subtitles: float) -> str:
+_METRICS_BY_NAME: Dict[str, MetricSpec] = {spec.name: spec for spec in METRICS}
+
+def generate_recommendation(pcts: Dict[str, float]) -> str:
     """
     Generates a recommendation based on weighted scores for each issue category.
 
     Parameters:
-    - content_quantity (float): Percentage score of content quantity (0-100).
-    - content_quality (float): Percentage score of content quality (0-100).
-    - metadata_quality (float): Percentage score of metadata quality (0-100).
-    - library_structure (float): Percentage score of library structure (0-100).
-    - plugins (float): Percentage score of plugins (0-100).
-    - subtitles (float): Percentage score of subtitles (0-100).
+    - pcts (Dict[str, float]): Percentage score (0-100) keyed by metric name.
     
     Returns:
     - str: A brief recommendation based on the most critical issue.
     """
     
-    # Weights for each category based on importance
-    weights = {
-        "Content Quantity": 4,
-        "Content Quality": 5,
-        "Metadata Quality": 3,
-        "Library Structure": 2,
-        "Plugins": 4,
-        "Subtitles": 3
-    }
-    
-    # Thresholds for recommending fixes (i.e., anything below 50% is considered needing improvement)
-    thresholds = {
-        "Content Quantity": 50,
-        "Content Quality": 50,
-        "Metadata Quality": 50,
-        "Library Structure": 70,
-        "Plugins": 50,
-        "Subtitles": 50
-    }
-    
-    # Store scores and recommendations
-    issues = {
-        "Content Quantity": content_quantity,
-        "Content Quality": content_quality,
-        "Metadata Quality": metadata_quality,
-        "Library Structure": library_structure,
-        "Plugins": plugins,
-        "Subtitles": subtitles
-    }
-    
-    # List to hold possible recommendations
-    recommendations = []
-    
-    # Iterate through issues and identify if any category is below its threshold
-    for category, score in issues.items():
-        if score < thresholds[category]:
-            # Formulate a recommendation based on category
-            if category == "Content Quantity":
-                recommendations.append("Increase the number of items in the library to improve content.")
-            elif category == "Content Quality":
-                recommendations.append("Upgrade videos to higher resolutions to enhance overall content quality.")
-            elif category == "Metadata Quality":
-                recommendations.append("Add missing metadata like movie posters and descriptions for a more organized library.")
-            elif category == "Library Structure":
-                recommendations.append("Reorganize the library structure for better content accessibility.")
-            elif category == "Plugins":
-                recommendations.append("Install key plugins to improve functionality and enhance server performance.")
-            elif category == "Subtitles":
-                recommendations.append("Add subtitles to your media for better accessibility and user experience.")
-    
-    # Sort recommendations by the weight of the category with the worst score
-    recommendations.sort(key=lambda x: weights.get(x.split()[0], 0), reverse=True)
-
-    # Return the most critical recommendation
-    if recommendations:
-        return recommendations[0]
+    # Categories below their threshold, as (category, weight, recommendation)
+    issues_below = [
+        (spec.name, spec.weight, spec.recommendation)
+        for spec in METRICS
+        if pcts[spec.name] < spec.threshold
+    ]
+
+    # Return the recommendation for the highest-weighted issue
+    if issues_below:
+        return max(issues_below, key=lambda issue: issue[1])[2]
     else:
         return "No improvements necessary."
 
@@ -305,32 +468,34 @@ def generate_recommendation(content_quantity: float, content_quality: float, met
 # --- SCORING WRAPPER WITH THREADING ---
 
 def max_score(metric_name: str) -> int:
-    return {
-        "Content Quantity": 10,
-        "Content Quality": 20,
-        "Metadata Quality": 20,
-        "Library Structure": 15,
-        "Plugins": 5,
-        "Subtitles": 5
-    }[metric_name]
+    return _METRICS_BY_NAME[metric_name].max_score
 
 def calculate_all_metrics_threaded() -> Dict[str, int]:
     """
-    Runs all metric functions in parallel threads and returns scores.
+    Runs all metric requests in parallel threads and returns scores.
+    The count and plugin requests run on worker threads while the calling
+    thread fetches the shared /Items payload over the same pooled session;
+    item-based scorers then run on that single payload once it lands.
     """
-    metric_funcs = {
-        "Content Quantity": lambda: min(10, int(get_total_item_count() / 1000 * 10)),
-        "Content Quality": get_content_quality_score,
-        "Metadata Quality": get_metadata_quality_score,
-        "Library Structure": get_library_structure_score,
-        "Plugins": get_plugin_score,
-        "Subtitles": get_subtitle_support_score
-    }
+    request_funcs = {spec.name: spec.scorer for spec in METRICS if not spec.uses_items}
+    item_funcs = {spec.name: spec.scorer for spec in METRICS if spec.uses_items}
 
     scores: Dict[str, int] = {}
 
-    with ThreadPoolExecutor(max_workers=6) as executor:
-        future_to_metric = {executor.submit(func): name for name, func in metric_funcs.items()}
+    with ThreadPoolExecutor(max_workers=max(1, len(request_funcs))) as executor:
+        future_to_metric = {executor.submit(func): name for name, func in request_funcs.items()}
+
+        try:
+            items = get_all_items()
+        except Exception:
+            items = None
+
+        for name, func in item_funcs.items():
+            try:
+                scores[name] = func(items) if items is not None else 0
+            except Exception:
+                scores[name] = 0  # fail-safe fallback
+
         for future in as_completed(future_to_metric):
             name = future_to_metric[future]
             try:
@@ -359,52 +524,19 @@ def print_score_summary() -> None:
         Also prints pros and cons based on threshold values.
     """
 
-    # Call your real scoring functions here
-    content_quantity_score = get_content_quantity_score()
-    content_quality_score = get_content_quality_score()
-    metadata_quality_score = get_metadata_quality_score()
-    library_structure_score = get_library_structure_score()
-    plugins_score = get_plugin_score()
-    subtitles_score = get_subtitles_score()
-    
-    max_scores = {
-        "content_quantity": 10,
-        "content_quality": 20,
-        "metadata_quality": 20,
-        "library_structure": 15,
-        "plugins": 6,
-        "subtitles": 5,
-    }
+    # Run every scorer concurrently, sharing one /Items fetch
+    scores = calculate_all_metrics_threaded()
 
     # Calculate percentages
-    content_quantity_pct = (content_quantity_score / max_scores["content_quantity"]) * 100
-    content_quality_pct = (content_quality_score / max_scores["content_quality"]) * 100
-    metadata_quality_pct = (metadata_quality_score / max_scores["metadata_quality"]) * 100
-    library_structure_pct = (library_structure_score / max_scores["library_structure"]) * 100
-    plugins_pct = (plugins_score / max_scores["plugins"]) * 100
-    subtitles_pct = (subtitles_score / max_scores["subtitles"]) * 100
-
-    total_score = sum([
-        content_quantity_score,
-        content_quality_score,
-        metadata_quality_score,
-        library_structure_score,
-        plugins_score,
-        subtitles_score,
-    ])
-    total_max = sum(max_scores.values())
-    total_pct = (total_score / total_max) * 100
+    pcts = {spec.name: (scores[spec.name] / spec.max_score) * 100 for spec in METRICS}
+    total_pct = (sum(scores.values()) / sum(spec.max_score for spec in METRICS)) * 100
 
     print("=====================================")
     print("=== JELLYFIN SERVER METRICS SCORE ===")
     print("=====================================")
     print()
-    print(f"Content Quantity     : {content_quantity_pct:.1f}%")
-    print(f"Content Quality      : {content_quality_pct:.1f}%")
-    print(f"Metadata Quality     : {metadata_quality_pct:.1f}%")
-    print(f"Library Structure    : {library_structure_pct:.1f}%")
-    print(f"Plugins              : {plugins_pct:.1f}%")
-    print(f"Subtitles            : {subtitles_pct:.1f}%")
+    for name, pct in pcts.items():
+        print(f"{name:<21}: {pct:.1f}%")
     print()
     print(f"TOTAL SCORE: {total_pct:.1f}%")
     print()
@@ -413,35 +545,11 @@ def print_score_summary() -> None:
     cons = []
 
     # Thresholds to determine pros/cons
-    if content_quantity_pct > 80:
-        pros.append("Content Quantity (Large library)")
-    else:
-        cons.append("Content Quantity (Small library)")
-
-    if content_quality_pct > 70:
-        pros.append("Content Quality (High-resolution videos)")
-    else:
-        cons.append("Content Quality (Low-resolution videos)")
-
-    if metadata_quality_pct > 70:
-        pros.append("Metadata Quality (Complete metadata)")
-    else:
-        cons.append("Metadata Quality (Incomplete metadata)")
-
-    if library_structure_pct > 60:
-        pros.append("Library Structure (Organized libraries)")
-    else:
-        cons.append("Library Structure (Disorganized libraries)")
-
-    if plugins_pct > 50:
-        pros.append("Plugins (Essential key plugins)")
-    else:
-        cons.append("Plugins (Missing key plugins)")
-
-    if subtitles_pct > 70:
-        pros.append("Subtitles (Massive subtitle availability)")
-    else:
-        cons.append("Subtitles (Limited subtitle availability)")
+    for spec in METRICS:
+        if pcts[spec.name] > spec.pros_threshold:
+            pros.append(f"{spec.name} ({spec.pro_msg})")
+        else:
+            cons.append(f"{spec.name} ({spec.con_msg})")
 
     print("-----------------------------------")
     print("!!!       RESULTS SUMMARY       !!!")
@@ -467,7 +575,7 @@ def print_score_summary() -> None:
     print()
 
     # Get the recommendation
-    recommendation = generate_recommendation(content_quantity_score, content_quality_score, metadata_quality_score, library_structure_score, plugins_score, subtitles_score)
+    recommendation = generate_recommendation(pcts)
 
     # Print the recommendation
     print(recommendation)